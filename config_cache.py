@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+config_cache.py
+Carga config.yaml con caché precompilada (marshal) en __pycache__/, indexada por
+mtime y tamaño del YAML. Si el YAML no cambió, no se importa ni se parsea PyYAML.
+"""
+import marshal
+import os
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent
+CONFIG_YAML = BASE_DIR / "config.yaml"
+CACHE_DIR = BASE_DIR / "__pycache__"
+CACHE_VERSION = 1
+
+def _cache_path(cfg_path: Path) -> Path:
+    return CACHE_DIR / f"{cfg_path.name}.cache"
+
+def _read_cache(cache: Path, key):
+    try:
+        with open(cache, "rb") as f:
+            stored_key, cfg = marshal.load(f)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    return cfg if stored_key == key else None
+
+def _write_cache(cache: Path, key, cfg):
+    try:
+        blob = marshal.dumps((key, cfg))
+    except ValueError:
+        # Tipos no serializables con marshal (p. ej. fechas YAML): sin caché
+        return
+    tmp = cache.with_suffix(f".tmp{os.getpid()}")
+    try:
+        cache.parent.mkdir(parents=True, exist_ok=True)
+        tmp.write_bytes(blob)
+        os.replace(tmp, cache)
+    except OSError:
+        # Caché opcional: si no se puede escribir (FS de solo lectura), seguimos
+        try:
+            tmp.unlink(missing_ok=True)
+        except OSError:
+            pass
+
+def load_config(cfg_path: Path = CONFIG_YAML) -> dict:
+    st = cfg_path.stat()
+    key = (CACHE_VERSION, str(cfg_path.resolve()), st.st_mtime_ns, st.st_size)
+    cache = _cache_path(cfg_path)
+    cfg = _read_cache(cache, key)
+    if cfg is not None:
+        return cfg
+
+    import yaml
+    cfg = yaml.safe_load(cfg_path.read_text(encoding="utf-8"))
+    _write_cache(cache, key, cfg)
+    return cfg
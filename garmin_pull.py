@@ -1,20 +1,20 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
-import os, json, time, argparse, datetime as dt, subprocess, shlex
+from __future__ import annotations
+
+import os, csv, json, time, argparse, datetime as dt, subprocess, shlex
 from pathlib import Path
-from typing import Any, Dict
-import pandas as pd
+from typing import TYPE_CHECKING, Any, Dict
 
-try:
+if TYPE_CHECKING:
     from garminconnect import Garmin
-except Exception as e:
-    raise SystemExit("Falta 'garminconnect'. Activa el venv e instala requirements.txt") from e
 
 BASE_DIR = Path(__file__).resolve().parent
 DATA_DIR = BASE_DIR / "data"
 SNAP_DIR = DATA_DIR / "snapshots"
 LATEST_JSON = DATA_DIR / "metrics_latest.json"
 LOG_CSV = DATA_DIR / "metrics_log.csv"
+CSV_FIELDS = ["ts_iso", "label", "source_date", "latest_hr", "sleep_score", "stress_avg", "body_battery"]
 
 def _env(name: str) -> str:
     v = os.environ.get(name)
@@ -23,6 +23,11 @@ def _env(name: str) -> str:
     return v
 
 def login_client() -> Garmin:
+    # Import diferido: garminconnect es pesado y solo hace falta al hacer login
+    try:
+        from garminconnect import Garmin
+    except Exception as e:
+        raise SystemExit("Falta 'garminconnect'. Activa el venv e instala requirements.txt") from e
     g = Garmin(_env("GARMIN_USER"), _env("GARMIN_PASS"))
     g.login()
     return g
@@ -127,11 +132,12 @@ def append_csv(obj: Dict[str, Any]):
         "stress_avg": obj.get("stress_avg"),
         "body_battery": obj.get("body_battery"),
     }
-    df = pd.DataFrame([row])
-    if LOG_CSV.exists():
-        df.to_csv(LOG_CSV, mode="a", header=False, index=False)
-    else:
-        df.to_csv(LOG_CSV, index=False)
+    write_header = not LOG_CSV.exists()
+    with open(LOG_CSV, "a", encoding="utf-8", newline="") as f:
+        w = csv.DictWriter(f, fieldnames=CSV_FIELDS, lineterminator="\n")
+        if write_header:
+            w.writeheader()
+        w.writerow(row)
 
 def run(cmd, check=False):
     return subprocess.run(shlex.split(cmd), cwd=str(BASE_DIR), capture_output=True, text=True, check=check)
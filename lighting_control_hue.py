@@ -9,15 +9,14 @@ import os
 import json
 import time
 import math
-import requests
 from datetime import datetime, time as dtime
 from pathlib import Path
 from typing import Tuple
 
-import yaml
+from config_cache import load_config
 
 BASE_DIR = Path(__file__).resolve().parent
-CFG = yaml.safe_load((BASE_DIR / "config.yaml").read_text(encoding="utf-8"))
+CFG = load_config(BASE_DIR / "config.yaml")
 DATA_JSON = BASE_DIR / "data" / "metrics_latest.json"
 
 HUE_IP = os.environ.get("HUE_BRIDGE_IP", "")
@@ -119,12 +118,19 @@ def intensity_to_bri(intensity: float) -> int:
     return int(clamp(round(intensity * 254), 1, 254))
 
 def set_hue_state(on: bool, bri: int, ct: int):
+    import requests  # diferido: solo se paga al primer envío
     url = f"http://{HUE_IP}/api/{HUE_USER}/lights/{HUE_LIGHT_ID}/state"
     payload = {"on": on, "bri": bri, "ct": ct}
     r = requests.put(url, json=payload, timeout=3)
     r.raise_for_status()
     return r.json()
 
+def next_state(smoother: Smoother, metrics: dict) -> Tuple[float, float, int, int]:
+    """Un ciclo del bucle sin E/S: devuelve (intensidad, CCT suavizadas, bri, ct)."""
+    intensity, cct = compute_targets(metrics)
+    i_s, k_s = smoother.step(intensity, cct)
+    return i_s, k_s, intensity_to_bri(i_s), kelvin_to_hue_ct(k_s)
+
 def main():
     if not HUE_IP or not HUE_USER:
         raise SystemExit("Configura HUE_BRIDGE_IP y HUE_USER_KEY en variables de entorno.")
@@ -137,11 +143,7 @@ def main():
                 time.sleep(2)
                 continue
             metrics = json.loads(DATA_JSON.read_text(encoding="utf-8"))
-            intensity, cct = compute_targets(metrics)
-            i_s, k_s = smoother.step(intensity, cct)
-
-            bri = intensity_to_bri(i_s)
-            ct = kelvin_to_hue_ct(k_s)
+            i_s, k_s, bri, ct = next_state(smoother, metrics)
 
             resp = set_hue_state(on=True, bri=bri, ct=ct)
             print(f"I={i_s:.2f} (bri={bri})  CCT={int(k_s)}K (ct={ct})  resp={resp}")
@@ -9,15 +9,14 @@ import os
 import json
 import time
 import math
-import serial
 from datetime import datetime, time as dtime
 from pathlib import Path
 from typing import Tuple
 
-import yaml
+from config_cache import load_config
 
 BASE_DIR = Path(__file__).resolve().parent
-CFG = yaml.safe_load((BASE_DIR / "config.yaml").read_text(encoding="utf-8"))
+CFG = load_config(BASE_DIR / "config.yaml")
 DATA_JSON = BASE_DIR / "data" / "metrics_latest.json"
 
 def clamp(x, a, b):
@@ -142,14 +141,24 @@ def compute_targets(metrics: dict) -> Tuple[float, float]:
 
     return float(intensity), float(cct)
 
+def next_rgb(smoother: Smoother, metrics: dict) -> Tuple[float, float, Tuple[int, int, int]]:
+    """Un ciclo del bucle sin E/S: devuelve (intensidad suavizada, CCT suavizada, RGB escalado)."""
+    intensity, cct = compute_targets(metrics)
+    i_s, cct_s = smoother.step(intensity, cct)
+
+    # Convertir a RGB según CCT, luego escalar por intensidad
+    r, g, b = cct_to_rgb(cct_s)
+    return i_s, cct_s, (int(r * i_s), int(g * i_s), int(b * i_s))
+
 def main():
     ser_cfg = CFG["serial"]
     port = ser_cfg["port"]
     baud = ser_cfg["baudrate"]
     smoother = Smoother(CFG["smoothing"]["alpha"], CFG["smoothing"]["hysteresis"])
 
-    # Abrir Serial
+    # Abrir Serial (import diferido: pyserial solo hace falta aquí)
     try:
+        import serial
         ser = serial.Serial(port, baudrate=baud, timeout=1)
         time.sleep(2)  # tiempo para que Arduino reinicie
     except Exception as e:
@@ -165,14 +174,7 @@ def main():
             with open(DATA_JSON, "r", encoding="utf-8") as f:
                 metrics = json.load(f)
 
-            intensity, cct = compute_targets(metrics)
-            i_s, cct_s = smoother.step(intensity, cct)
-
-            # Convertir a RGB según CCT, luego escalar por intensidad
-            r, g, b = cct_to_rgb(cct_s)
-            r = int(r * i_s)
-            g = int(g * i_s)
-            b = int(b * i_s)
+            i_s, cct_s, (r, g, b) = next_rgb(smoother, metrics)
 
             cmd = f"RGB,{r},{g},{b}\n"
             try:
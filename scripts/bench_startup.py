@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+bench_startup.py
+Mide el arranque en frío de los daemons: tiempo desde que se lanza el intérprete
+hasta la primera actualización de luz (serial / Hue) y hasta el primer pull de Garmin.
+
+Cada medición lanza un intérprete nuevo, igual que un reinicio de systemd o un cron,
+y ejecuta el main() real de cada script. Solo se sustituye la E/S (serial.Serial.write,
+requests.put, Garmin.login/get_heart_rates), que corta la ejecución en el primer envío.
+time.sleep se anula: la espera de reinicio del Arduino no es coste de arranque.
+
+Uso:
+  python scripts/bench_startup.py --runs 7
+  python scripts/bench_startup.py --max-ms 1500   # sale con código 1 si se supera o algo falla
+  python scripts/bench_startup.py --allow-missing # tolera pyserial/requests/garminconnect sin instalar
+"""
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+CACHE_FILE = BASE_DIR / "__pycache__" / "config.yaml.cache"
+
+SAMPLE_METRICS = {"latest_hr": 72, "stress_avg": 35.0, "sleep_score": 68}
+OPTIONAL_DEPS = {"serial", "requests", "garminconnect"}
+
+# Llega a la primera E/S lanzando _Done (BaseException: atraviesa los 'except Exception' del bucle)
+PRELUDE = """
+import sys, time
+from pathlib import Path
+class _Done(BaseException): pass
+def _done(*a, **k): raise _Done
+time.sleep = lambda s: None
+"""
+
+EPILOGUE = """
+try:
+    m.main()
+except _Done:
+    pass
+else:
+    sys.exit("main() terminó sin llegar a la primera E/S")
+"""
+
+SCENARIOS = {
+    "first_light_serial": """
+import serial
+class _FakeSerial:
+    def __init__(self, *a, **k): pass
+    write = _done
+    def close(self): pass
+serial.Serial = _FakeSerial
+import lighting_control_serial as m
+m.DATA_JSON = Path(METRICS_JSON)
+""",
+    "first_light_hue": """
+import requests
+requests.put = _done
+import lighting_control_hue as m
+m.DATA_JSON = Path(METRICS_JSON)
+""",
+    "first_pull": """
+import garminconnect
+class _FakeGarmin:
+    def __init__(self, *a, **k): pass
+    def login(self): pass
+    get_heart_rates = _done
+garminconnect.Garmin = _FakeGarmin
+sys.argv = ["garmin_pull.py"]
+import garmin_pull as m
+""",
+}
+
+BENCH_ENV = {
+    "GARMIN_USER": "bench@example.com",
+    "GARMIN_PASS": "bench",
+    "HUE_BRIDGE_IP": "127.0.0.1",
+    "HUE_USER_KEY": "bench",
+}
+
+def run_once(code: str, env: dict):
+    t0 = time.perf_counter()
+    p = subprocess.run([sys.executable, "-c", code], cwd=str(BASE_DIR), env=env, capture_output=True, text=True)
+    elapsed_ms = (time.perf_counter() - t0) * 1000.0
+    if p.returncode != 0:
+        err = (p.stderr or "").strip().splitlines()
+        return None, err[-1] if err else f"exit {p.returncode}"
+    return elapsed_ms, None
+
+def missing_optional(err: str) -> bool:
+    mo = re.match(r"ModuleNotFoundError: No module named '([\w.]+)'", err or "")
+    return bool(mo) and mo.group(1).split(".")[0] in OPTIONAL_DEPS
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--runs", type=int, default=5, help="Repeticiones por escenario")
+    ap.add_argument("--max-ms", type=float, default=None, help="Umbral de mediana (ms); falla si se supera")
+    ap.add_argument("--cold-config", action="store_true", help="Borrar la caché de config.yaml antes de cada run")
+    ap.add_argument("--allow-missing", action="store_true", help="No fallar si falta una dependencia opcional")
+    ap.add_argument("--only", choices=sorted(SCENARIOS), action="append", help="Ejecutar solo estos escenarios")
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        metrics_json = Path(tmp) / "metrics_latest.json"
+        metrics_json.write_text(json.dumps(SAMPLE_METRICS), encoding="utf-8")
+        env = {**os.environ, **BENCH_ENV}
+        failed = run_scenarios(args, metrics_json, env)
+
+    if failed:
+        raise SystemExit(1)
+
+def run_scenarios(args, metrics_json: Path, env: dict) -> bool:
+    baseline, err = run_once("pass", env)
+    print(f"[BENCH] intérprete vacío: {baseline:.1f} ms" if baseline is not None else f"[BENCH] intérprete: {err}")
+
+    failed = False
+    for name in args.only or SCENARIOS:
+        code = f"METRICS_JSON = {str(metrics_json)!r}\n" + PRELUDE + SCENARIOS[name] + EPILOGUE
+        times = []
+        err = None
+        for _ in range(max(1, args.runs)):
+            if args.cold_config:
+                CACHE_FILE.unlink(missing_ok=True)
+            ms, err = run_once(code, env)
+            if ms is None:
+                break
+            times.append(ms)
+        if err:
+            if args.allow_missing and missing_optional(err):
+                print(f"[BENCH] {name:<20} n/a ({err})")
+            else:
+                print(f"[BENCH] {name:<20} ERROR ({err})")
+                failed = True
+            continue
+        med = statistics.median(times)
+        flag = ""
+        if args.max_ms is not None and med > args.max_ms:
+            flag = f"  > {args.max_ms:.0f} ms"
+            failed = True
+        print(f"[BENCH] {name:<20} mediana={med:7.1f} ms  min={min(times):7.1f} ms  max={max(times):7.1f} ms{flag}")
+    return failed
+
+if __name__ == "__main__":
+    main()